@@ -0,0 +1,130 @@
+"""Tests for TrackLab core model serialization."""
+
+import json
+from datetime import datetime
+
+import pytest
+
+from tracklab.core.base_models import RecordType, StatsType
+from tracklab.core.core_records import (
+    Record,
+    RunRecord,
+    HistoryRecord,
+    HistoryItem,
+    HistoryStep,
+    ConfigRecord,
+    ConfigItem,
+    MetricRecord,
+    MetricSummary,
+    StatsRecord,
+)
+from tracklab.core.request_response import Request, PauseRequest, ResumeRequest
+
+
+class TestFromDict:
+    """Test dictionary round-trips through the generated constructors."""
+
+    def test_run_record_round_trip(self):
+        """Nested records, enums and datetimes are rebuilt."""
+        run = RunRecord(
+            run_id="abc",
+            research_name="paper",
+            experiment_name="baseline",
+            start_time=datetime(2024, 1, 10, 9, 0),
+            config=ConfigRecord(update=[ConfigItem(key="lr", value_json="0.1")]),
+        )
+        record = Record(run=run)
+
+        restored = Record.from_dict(json.loads(record.to_json()))
+
+        assert restored.record_type == RecordType.RUN
+        assert restored.run == run
+        assert restored.run.start_time == datetime(2024, 1, 10, 9, 0)
+        assert isinstance(restored.run.config.update[0], ConfigItem)
+
+    def test_history_record_round_trip(self):
+        """History items and step are rebuilt as models."""
+        history = HistoryRecord(step=HistoryStep(num=3))
+        history.add_item("loss", 0.5)
+        record = Record(num=3, history=history)
+
+        restored = Record.from_dict(json.loads(record.to_json()))
+
+        assert restored.history == history
+        assert restored.history.item[0].get_value() == 0.5
+
+    def test_malformed_datetime_is_ignored(self):
+        """An unparsable start_time falls back to the current time."""
+        run = RunRecord.from_dict({"run_id": "abc", "start_time": "not-a-date"})
+        assert isinstance(run.start_time, datetime)
+
+    def test_fields_resolved_by_type(self):
+        """Fields sharing a name resolve to their declared types."""
+        metric = MetricRecord.from_dict({"name": "acc", "summary": {"max": 1.0}})
+        assert metric.summary == MetricSummary(max=1.0)
+
+        stats = StatsRecord.from_dict({"stats_type": "gpu", "item": []})
+        assert stats.stats_type == StatsType.GPU
+
+    def test_forward_references_resolved(self):
+        """Forward-referenced request fields are rebuilt as models."""
+        request = Request.from_dict({"request_type": "pause", "pause": {}})
+        assert request.pause == PauseRequest()
+
+
+class TestToDict:
+    """Test conversion of models to dictionaries."""
+
+    def test_nested_none_fields_omitted(self):
+        """None fields are skipped on nested models too."""
+        record = Record(uuid="u", run=RunRecord(run_id="abc", start_time=datetime(2024, 1, 1)))
+
+        data = record.to_dict()
+
+        assert data["record_type"] == "run"
+        assert "history" not in data
+        assert "config" not in data["run"]
+        assert data["run"]["start_time"] == "2024-01-01T00:00:00"
+
+    def test_empty_model(self):
+        """Models without fields convert to an empty dictionary."""
+        assert PauseRequest().to_dict() == {}
+
+
+class TestEmptyModel:
+    """Test shared instances of field-less models."""
+
+    def test_instances_shared_per_class(self):
+        """Each empty model class hands out a single instance."""
+        assert PauseRequest() is PauseRequest()
+        assert PauseRequest.from_dict({}) is PauseRequest()
+        assert Request.from_dict({"pause": {}}).pause is PauseRequest()
+
+    def test_instances_not_shared_across_classes(self):
+        """Different empty model classes keep separate instances."""
+        assert PauseRequest() is not ResumeRequest()
+        assert PauseRequest() != ResumeRequest()
+
+
+class TestItemValues:
+    """Test JSON encoding of item values."""
+
+    @pytest.mark.parametrize(
+        "value", [0, -3, 10**20, 0.1, 1e16, -0.0, float("nan"), float("inf"), True, None, "x", [1, 2.5]]
+    )
+    def test_matches_json_dumps(self, value):
+        """Values encode exactly as json.dumps would encode them."""
+        item = HistoryItem(key="k")
+        item.set_value(value)
+        assert item.value_json == json.dumps(value)
+
+    def test_numpy_values(self):
+        """NumPy scalars and arrays encode as plain JSON values."""
+        np = pytest.importorskip("numpy")
+        item = HistoryItem(key="k")
+
+        item.set_value(np.float32(0.5))
+        assert item.get_value() == 0.5
+
+        item.set_value(np.arange(3))
+        assert item.get_value() == [0, 1, 2]
@@ -0,0 +1,326 @@
+"""Tests for the TrackLab LevelDB data store."""
+
+import json
+import math
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from tracklab.core.base_models import RecordType
+from tracklab.core.storage import data_store_context
+from tracklab.core.core_records import (
+    HistoryRecord,
+    HistoryStep,
+    MetricRecord,
+    MetricSummary,
+    Record,
+    RunRecord,
+)
+
+
+@pytest.fixture
+def store(tmp_path):
+    """Create a temporary datastore for testing."""
+    with data_store_context(str(tmp_path)) as store:
+        yield store
+
+
+class TestRecordEncoding:
+    """Test how records are serialized to LevelDB."""
+
+    def test_round_trip(self, store):
+        """A written record reads back unchanged."""
+        run = RunRecord(run_id="run-1", research_name="paper", experiment_name="exp")
+        key = store.write_run_record(run)
+
+        assert store.read_record(key).run == run
+        assert store.get_run_record("run-1") == run
+
+    def test_rows_stored_as_json(self, store):
+        """Rows are JSON regardless of which optional encoders are installed."""
+        key = store.write_run_record(RunRecord(run_id="run-1"))
+        assert json.loads(store.db.get(key.encode()))["run"]["run_id"] == "run-1"
+
+    def test_values_outside_annotations_round_trip(self, store):
+        """Values that do not match a field's annotation are not dropped."""
+        key = store.write_run_record(RunRecord(run_id="run-1", starting_step=2.5))
+        history_key = store.write_records([Record(history=HistoryRecord(step=HistoryStep(num=1.0)))])[0]
+
+        assert store.read_record(key).run.starting_step == 2.5
+        assert store.read_record(history_key).history.step.num == 1.0
+
+    def test_non_finite_floats_round_trip(self, store):
+        """NaN and infinities are stored as such, with or without orjson."""
+        summary = MetricSummary(min=float("inf"), max=float("-inf"), mean=float("nan"))
+        key = store.write_record(Record(metric=MetricRecord(name="loss", summary=summary)))
+
+        stored = store.read_record(key).metric.summary
+        assert (stored.min, stored.max) == (float("inf"), float("-inf"))
+        assert math.isnan(stored.mean)
+
+    def test_wide_integers_round_trip(self, store):
+        """Integers wider than 64 bits are stored exactly."""
+        key = store.write_record(Record(num=2**70, run=RunRecord(run_id="run-1")))
+
+        assert store.read_record(key).num == 2**70
+
+    def test_reads_legacy_json_rows(self, store):
+        """Rows stored as JSON text are still readable."""
+        record = Record(run=RunRecord(run_id="legacy"))
+        store.db.put(b"run:0:legacy", record.to_json().encode())
+
+        assert store.read_record("run:0:legacy").run.run_id == "legacy"
+        assert [r.run.run_id for r in store.scan_records()] == ["legacy"]
+
+
+class TestReadRecord:
+    """Test reading single records."""
+
+    def test_returned_records_not_shared(self, store):
+        """Changing a returned record does not affect later reads."""
+        store.write_run_record(RunRecord(run_id="run-1", experiment_name="exp"))
+        store.get_run_record("run-1").experiment_name = "changed"
+
+        assert store.get_run_record("run-1").experiment_name == "exp"
+
+    def test_deleted_records_not_returned(self, store):
+        """A record read before being deleted is not returned afterwards."""
+        key = store.write_run_record(RunRecord(run_id="run-1"))
+        assert store.read_record(key) is not None
+        store.db.delete(key.encode())
+
+        assert store.read_record(key.encode()) is None
+
+
+class TestScanRecords:
+    """Test scanning records by type."""
+
+    def test_scan_stops_at_record_type(self, store):
+        """Only records of the requested type are returned."""
+        store.write_config("run-1", {"lr": 0.1})
+        store.write_run_record(RunRecord(run_id="run-1"))
+        store.write_history("run-1", 0, {"loss": 1.0})
+
+        assert [r.run.run_id for r in store.scan_records(RecordType.RUN)] == ["run-1"]
+        assert len(list(store.scan_records(RecordType.HISTORY))) == 1
+        assert len(list(store.scan_records())) == 3
+
+    def test_scan_limit(self, store):
+        """At most ``limit`` records are returned."""
+        for i in range(5):
+            store.write_run_record(RunRecord(run_id=f"run-{i}"))
+
+        assert len(list(store.scan_records(RecordType.RUN, limit=2))) == 2
+
+
+class TestBatchWrites:
+    """Test batched record writes."""
+
+    def test_write_records_returns_keys_in_order(self, store):
+        """Each record gets its own key and reads back in order."""
+        runs = [RunRecord(run_id=f"run-{i}") for i in range(3)]
+        keys = store.write_records([Record(run=run) for run in runs])
+
+        assert len(set(keys)) == 3
+        assert [store.read_record(k).run for k in keys] == runs
+        assert store.get_run_record("run-2") == runs[2]
+
+    def test_write_records_updates_run_index(self, store):
+        """Records written with a run_id are added to that run's index."""
+        store.write_history("run-1", 0, {"loss": 1.0})
+        keys = store.write_records(
+            [Record(run=RunRecord(run_id="a")), Record(run=RunRecord(run_id="b"))],
+            run_id="run-1",
+        )
+
+        assert store._get_run_records("run-1")[1:] == keys
+
+
+class TestRunIndex:
+    """Test the per-run record index."""
+
+    def test_index_survives_reopen(self, tmp_path):
+        """Reopening a store neither reuses keys nor loses index entries."""
+        with data_store_context(str(tmp_path)) as store:
+            first = store.write_history("run-1", 0, {"loss": 1.0})
+        with data_store_context(str(tmp_path)) as store:
+            second = store.write_history("run-1", 1, {"loss": 0.5})
+
+            assert first != second
+            assert store._get_run_records("run-1") == [first, second]
+            assert [h.step.num for h in store.get_history("run-1")] == [0, 1]
+
+    def test_concurrent_writers(self, store):
+        """Records written from several threads all get distinct keys."""
+        def write(thread):
+            return [store.write_history("run-1", step, {"thread": thread}) for step in range(50)]
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            keys = [key for batch in pool.map(write, range(4)) for key in batch]
+
+        assert len(set(keys)) == 200
+        assert sorted(store._get_run_records("run-1")) == sorted(keys)
+
+    def test_run_ids_sharing_a_prefix(self, store):
+        """A run's index does not include runs whose IDs extend its own."""
+        key = store.write_config("a", {"lr": 0.1})
+        store.write_config("a:b", {"lr": 0.2})
+
+        assert store._get_run_records("a") == [key]
+
+    def test_recovered_sequence_persisted(self, tmp_path):
+        """The sequence recovered from an older database is stored on open."""
+        with data_store_context(str(tmp_path)) as store:
+            store.write_history("run-1", 0, {"loss": 1.0})
+            store.meta_db.delete(b"write_seq")
+
+        with data_store_context(str(tmp_path)) as store:
+            assert store.meta_db.get(b"write_seq") == b"1"
+
+    def test_reads_legacy_json_index(self, store):
+        """Run indices stored as a single JSON list are still read."""
+        store.meta_db.put(b"run_records:run-1", json.dumps(["a", "b"]).encode())
+        key = store.write_history("run-1", 0, {"loss": 1.0})
+
+        assert store._get_run_records("run-1") == ["a", "b", key]
+
+
+class TestGetHistory:
+    """Test reading a run's history."""
+
+    def test_history_ordered_by_step(self, store):
+        """History comes back in step order regardless of write order."""
+        for step in (5, 1, 10, 3):
+            store.write_history("run-1", step, {"step": step})
+        store.write_history("run-2", 2, {"step": 2})
+
+        assert [h.step.num for h in store.get_history("run-1")] == [1, 3, 5, 10]
+
+    def test_history_step_range(self, store):
+        """min_step and max_step are both inclusive."""
+        for step in range(10):
+            store.write_history("run-1", step, {"step": step})
+
+        history = store.get_history("run-1", min_step=3, max_step=6)
+        assert [h.step.num for h in history] == [3, 4, 5, 6]
+
+    def test_float_steps(self, store):
+        """Integral float steps are accepted and indexed as integers."""
+        store.write_history("run-1", 2.0, {"loss": 1.0})
+
+        assert [h.step.num for h in store.get_history("run-1")] == [2]
+
+    def test_non_integral_steps_rejected(self, store):
+        """Fractional steps raise instead of being truncated."""
+        with pytest.raises(ValueError):
+            store.write_history("run-1", 2.5, {"loss": 1.0})
+
+        assert store.get_history("run-1") == []
+
+    def test_large_steps(self, store):
+        """Steps wider than twelve digits, such as timestamps, are ordered and filtered."""
+        base = 1_700_000_000_000
+        for step in (base + 2, base, base + 1):
+            store.write_history("run-1", step, {"step": step})
+
+        history = store.get_history("run-1", min_step=base + 1)
+        assert [h.step.num for h in history] == [base + 1, base + 2]
+
+    def test_negative_steps(self, store):
+        """Negative steps sort numerically before non-negative ones."""
+        for step in (-1, 3, -5, 0):
+            store.write_history("run-1", step, {"step": step})
+
+        assert [h.step.num for h in store.get_history("run-1", min_step=-10)] == [-5, -1, 0, 3]
+        assert [h.step.num for h in store.get_history("run-1", min_step=-3, max_step=0)] == [-1, 0]
+
+    def test_failed_write_leaves_no_rows(self, store):
+        """A record that cannot be keyed or indexed writes nothing at all."""
+        bad = Record(history=HistoryRecord(step=HistoryStep(num="x")))
+        with pytest.raises((TypeError, ValueError)):
+            store.write_records([Record(run=RunRecord(run_id="ok")), bad], run_id="run-1")
+
+        assert list(store.db.iterator()) == []
+        assert store._get_run_records("run-1") == []
+        assert store.get_run_record("ok") is None
+
+    def test_history_index_built_for_older_databases(self, tmp_path):
+        """Runs indexed before the history index existed are backfilled."""
+        with data_store_context(str(tmp_path)) as store:
+            for step in (2, 0, 1):
+                store.write_history("run-1", step, {"step": step})
+            for key in list(store.meta_db.iterator(prefix=b"run_history:", include_value=False)):
+                store.meta_db.delete(key)
+            store.meta_db.delete(b"indexed:history")
+
+        with data_store_context(str(tmp_path)) as store:
+            assert [h.step.num for h in store.get_history("run-1")] == [0, 1, 2]
+
+
+class TestRunIndices:
+    """Test the research/experiment secondary indices."""
+
+    def test_names_containing_separator(self, store):
+        """Names containing ':' do not leak into other researches."""
+        store.write_run_record(RunRecord(research_name="a", experiment_name="b:c"))
+        store.write_run_record(RunRecord(research_name="a:b", experiment_name="c"))
+
+        assert store.list_research_names() == ["a", "a:b"]
+        assert store.list_experiment_names("a") == ["b:c"]
+        assert len(list(store.iter_runs_by_time("a"))) == 1
+
+    def test_indices_built_for_older_databases(self, tmp_path):
+        """Stores opened without indices have them rebuilt from run records."""
+        with data_store_context(str(tmp_path)) as store:
+            store.write_run_record(RunRecord(research_name="paper", experiment_name="exp"))
+            for key in list(store.meta_db.iterator(include_value=False)):
+                store.meta_db.delete(key)
+
+        with data_store_context(str(tmp_path)) as store:
+            assert store.list_research_names() == ["paper"]
+            assert store.list_experiment_names("paper") == ["exp"]
+
+
+class TestDecodedStrings:
+    """Test string sharing between decoded records."""
+
+    def test_metric_keys_shared(self, store):
+        """The same metric key decodes to one shared string."""
+        store.write_history("run-1", 0, {"".join(["lo", "ss"]): 1.0})
+        store.write_history("run-1", 1, {"".join(["lo", "ss"]): 0.5})
+
+        first, second = store.get_history("run-1")
+        assert first.item[0].key is second.item[0].key
+
+    def test_null_names_readable(self, store):
+        """Rows whose research or experiment name is null still decode."""
+        row = {"record_type": "run", "run": {"run_id": "run-1", "research_name": None, "experiment_name": None}}
+        store.db.put(b"run:0:1", json.dumps(row).encode())
+
+        run = store.read_record("run:0:1").run
+        assert run.run_id == "run-1"
+        assert run.research_name is None
+
+
+    def test_non_string_keys_readable(self, store):
+        """Records with non-string metric or config keys still decode."""
+        store.write_history("run-1", 0, {1: 0.5, "a": 2})
+        key = store.write_config("run-1", {2: "x"})
+
+        [history] = store.get_history("run-1")
+        assert [item.key for item in history.item] == [1, "a"]
+        assert [item.key for item in store.read_record(key).config.update] == [2]
+
+
+class TestMissingKeys:
+    """Test lookups of keys that do not exist."""
+
+    def test_read_missing_record(self, store, caplog):
+        """A missing key returns None without logging an error."""
+        assert store.read_record("run:0:404") is None
+        assert not caplog.records
+
+    def test_get_missing_run(self, store):
+        """An unknown run ID returns None."""
+        store.write_run_record(RunRecord(run_id="run-1"))
+        assert store.get_run_record("run-2") is None
@@ -1,5 +1,5 @@
 import pytest
-from tracklab.errors import Error
+from tracklab.errors import Error, UsageError
 from tracklab.errors.util import ProtobufErrorHandler, ErrorInfo, ErrorCode
 
 
@@ -18,3 +18,29 @@ def test_protobuf_error_handler(error, expected):
 def test_protobuf_error_handler_exception():
     with pytest.raises(TypeError):
         ProtobufErrorHandler.from_exception(Exception(""))  # type: ignore
+
+
+@pytest.mark.parametrize("code", list(ErrorCode))
+def test_protobuf_error_handler_round_trip(code):
+    exc = ProtobufErrorHandler.to_exception(ErrorInfo(code=code, message="test error"))
+    assert ProtobufErrorHandler.from_exception(exc) == ErrorInfo(code=code, message="test error")
+
+
+def test_protobuf_error_handler_subclass():
+    class CustomUsageError(UsageError):
+        pass
+
+    info = ProtobufErrorHandler.from_exception(CustomUsageError("test error"))
+    assert info.code == ErrorCode.USAGE
+
+
+@pytest.mark.parametrize(
+    "data, expected",
+    [
+        ({"code": "USAGE", "message": "m"}, ErrorInfo(code=ErrorCode.USAGE, message="m")),
+        ({}, ErrorInfo(code=ErrorCode.UNKNOWN, message="")),
+        ({"code": "NOT_A_CODE"}, ErrorInfo(code=ErrorCode.UNKNOWN, message="")),
+    ],
+)
+def test_error_info_from_dict(data, expected):
+    assert ErrorInfo.from_dict(data) == expected
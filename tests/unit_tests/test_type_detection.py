@@ -0,0 +1,64 @@
+import sys
+import types
+from unittest import mock
+
+from tracklab.utils import type_detection
+
+
+class _FakeTensor:
+    pass
+
+
+def test_tensor_checks_without_frameworks(monkeypatch):
+    for name in ("torch", "tensorflow", "jax.numpy"):
+        monkeypatch.delitem(sys.modules, name, raising=False)
+
+    assert not type_detection.is_pytorch_tensor(object())
+    assert not type_detection.is_tf_tensor(object())
+    assert type_detection.get_jax_tensor(object()) is None
+    assert "torch" not in sys.modules
+
+
+def test_tensor_checks_with_loaded_frameworks(monkeypatch):
+    monkeypatch.setitem(sys.modules, "torch", types.SimpleNamespace(Tensor=_FakeTensor))
+    monkeypatch.setitem(sys.modules, "tensorflow", types.SimpleNamespace(Tensor=_FakeTensor))
+    monkeypatch.setitem(sys.modules, "jax.numpy", types.SimpleNamespace(ndarray=_FakeTensor))
+    tensor = _FakeTensor()
+
+    assert type_detection.is_pytorch_tensor(tensor)
+    assert type_detection.is_tf_tensor(tensor)
+    assert type_detection.get_jax_tensor(tensor) is tensor
+    assert not type_detection.is_pytorch_tensor(object())
+
+
+def test_matplotlib_contains_images():
+    class Artist:
+        def __init__(self, *children):
+            self.children = children
+
+        def get_children(self):
+            return list(self.children)
+
+    class AxesImage:
+        pass
+
+    mpimg = types.SimpleNamespace(AxesImage=AxesImage)
+    with mock.patch.object(type_detection, "get_module", return_value=mpimg):
+        assert type_detection.matplotlib_contains_images(Artist(Artist(), Artist(AxesImage())))
+        assert not type_detection.matplotlib_contains_images(Artist(Artist(Artist())))
+
+    with mock.patch.object(type_detection, "get_module", return_value=None):
+        assert not type_detection.matplotlib_contains_images(Artist(AxesImage()))
+
+
+def test_pandas_data_frame_check(monkeypatch):
+    class DataFrame:
+        pass
+
+    monkeypatch.setattr(type_detection, "pd_available", True)
+    monkeypatch.delitem(sys.modules, "pandas", raising=False)
+    assert not type_detection.is_pandas_data_frame(DataFrame())
+
+    monkeypatch.setitem(sys.modules, "pandas", types.SimpleNamespace(DataFrame=DataFrame))
+    assert type_detection.is_pandas_data_frame(DataFrame())
+    assert not type_detection.is_pandas_data_frame(object())
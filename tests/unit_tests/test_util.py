@@ -76,6 +76,23 @@ def test_jsonify_enum():
     assert converted
 
 
+@pytest.mark.parametrize(
+    "obj, expected",
+    [
+        ("a", ("a", False)),
+        (3, (3, False)),
+        (True, (True, False)),
+        (None, (None, False)),
+        (1.5, (1.5, False)),
+        (float("nan"), ("NaN", True)),
+        (float("inf"), ("Infinity", True)),
+        (float("-inf"), ("-Infinity", True)),
+    ],
+)
+def test_jsonify_builtin_scalars(obj, expected):
+    assert util.json_friendly(obj) == expected
+
+
 # PyTorch-specific test removed - TrackLab no longer requires PyTorch dependency
 
 
@@ -2,7 +2,7 @@
 
 # Import from new modular structure
 from .base_models import (
-    BaseModel, RecordType, StatsType, OutputType,
+    BaseModel, EmptyModel, RecordType, StatsType, OutputType,
     RecordInfo, Control
 )
 
@@ -56,7 +56,7 @@ except ImportError:
 
 __all__ = [
     # Base models and enums  
-    'BaseModel', 'RecordType', 'StatsType', 'OutputType',
+    'BaseModel', 'EmptyModel', 'RecordType', 'StatsType', 'OutputType',
     'RecordInfo', 'Control',
     
     # Core records
@@ -3,8 +3,11 @@
 This module contains the fundamental building blocks for all TrackLab data structures.
 """
 
-from dataclasses import dataclass, field, asdict
-from typing import Dict, Any, Optional, List
+from dataclasses import dataclass, field, fields
+from typing import (
+    Dict, Any, Callable, Optional, List, Union,
+    get_args, get_origin, get_type_hints,
+)
 from datetime import datetime
 from enum import Enum
 import json
@@ -53,25 +56,11 @@ class BaseModel:
     
     def to_dict(self) -> dict:
         """Convert to dictionary, handling nested objects."""
-        def convert(obj):
-            if hasattr(obj, 'to_dict'):
-                return obj.to_dict()
-            elif isinstance(obj, Enum):
-                return obj.value
-            elif isinstance(obj, list):
-                return [convert(item) for item in obj]
-            elif isinstance(obj, dict):
-                return {k: convert(v) for k, v in obj.items()}
-            elif isinstance(obj, datetime):
-                return obj.isoformat()
-            else:
-                return obj
-        
-        data = {}
-        for key, value in asdict(self).items():
-            if value is not None:  # Skip None values
-                data[key] = convert(value)
-        return data
+        cls = type(self)
+        build = _to_dict_builders.get(cls)
+        if build is None:
+            build = _to_dict_builders[cls] = _make_to_dict(cls)
+        return build(self)
     
     def to_json(self) -> str:
         """Convert to JSON string."""
@@ -85,95 +74,149 @@ class BaseModel:
     @classmethod
     def from_dict(cls, data: dict):
         """Create instance from dictionary."""
-        # Import here to avoid circular imports
-        from .core_records import (
-            RunRecord, HistoryRecord, SummaryRecord, ConfigRecord,
-            OutputRecord, StatsRecord, MetricRecord, FilesRecord, FilesItem,
-            HistoryStep, HistoryItem, ConfigItem, SummaryItem, StatsItem,
-            MetricOptions, MetricControl,
-            GitRepoRecord, TelemetryRecord, SettingsRecord, SettingsItem
-        )
-        from .request_response import Request, Response
-        
-        # Handle nested objects properly
-        kwargs = {}
-        for key, value in data.items():
-            if key == 'record_type' and isinstance(value, str):
-                kwargs[key] = RecordType(value)
-            elif key == 'output_type' and isinstance(value, str):
-                kwargs[key] = OutputType(value)
-            elif key == 'stats_type' and isinstance(value, str):
-                kwargs[key] = StatsType(value)
-            elif key == 'control' and isinstance(value, dict):
-                kwargs[key] = Control.from_dict(value)
-            elif key == '_info' and isinstance(value, dict):
-                kwargs[key] = RecordInfo.from_dict(value)
-            elif key == 'run' and isinstance(value, dict):
-                kwargs[key] = RunRecord.from_dict(value)
-            elif key == 'history' and isinstance(value, dict):
-                kwargs[key] = HistoryRecord.from_dict(value)
-            elif key == 'config' and isinstance(value, dict):
-                kwargs[key] = ConfigRecord.from_dict(value)
-            elif key == 'summary' and isinstance(value, dict):
-                kwargs[key] = SummaryRecord.from_dict(value)
-            elif key == 'output' and isinstance(value, dict):
-                kwargs[key] = OutputRecord.from_dict(value)
-            elif key == 'stats' and isinstance(value, dict):
-                kwargs[key] = StatsRecord.from_dict(value)
-            elif key == 'artifact' and isinstance(value, dict):
-                kwargs[key] = ArtifactRecord.from_dict(value)
-            elif key == 'metric' and isinstance(value, dict):
-                kwargs[key] = MetricRecord.from_dict(value)
-            elif key == 'step' and isinstance(value, dict):
-                kwargs[key] = HistoryStep.from_dict(value)
-            elif key == 'options' and isinstance(value, dict):
-                kwargs[key] = MetricOptions.from_dict(value)
-            elif key == '_control' and isinstance(value, dict):
-                kwargs[key] = MetricControl.from_dict(value)
-            elif key == 'manifest' and isinstance(value, dict):
-                kwargs[key] = ArtifactManifest.from_dict(value)
-            elif key == 'git' and isinstance(value, dict):
-                kwargs[key] = GitRepoRecord.from_dict(value)
-            elif key == 'telemetry' and isinstance(value, dict):
-                kwargs[key] = TelemetryRecord.from_dict(value)
-            elif key == 'settings' and isinstance(value, dict):
-                kwargs[key] = SettingsRecord.from_dict(value)
-            elif key == 'item' and isinstance(value, list):
-                # Handle lists of items
-                if cls.__name__ == 'HistoryRecord':
-                    kwargs[key] = [HistoryItem.from_dict(i) if isinstance(i, dict) else i for i in value]
-                elif cls.__name__ == 'ConfigRecord':
-                    kwargs[key] = [ConfigItem.from_dict(i) if isinstance(i, dict) else i for i in value]
-                elif cls.__name__ == 'SummaryRecord':
-                    kwargs[key] = [SummaryItem.from_dict(i) if isinstance(i, dict) else i for i in value]
-                elif cls.__name__ == 'StatsRecord':
-                    kwargs[key] = [StatsItem.from_dict(i) if isinstance(i, dict) else i for i in value]
-                elif cls.__name__ == 'SettingsRecord':
-                    kwargs[key] = [SettingsItem.from_dict(i) if isinstance(i, dict) else i for i in value]
-                else:
-                    kwargs[key] = value
-            elif key == 'update' and isinstance(value, list):
-                # Handle update lists
-                if cls.__name__ == 'ConfigRecord':
-                    kwargs[key] = [ConfigItem.from_dict(i) if isinstance(i, dict) else i for i in value]
-                elif cls.__name__ == 'SummaryRecord':
-                    kwargs[key] = [SummaryItem.from_dict(i) if isinstance(i, dict) else i for i in value]
-                else:
-                    kwargs[key] = value
-            elif key == 'remove' and isinstance(value, list):
-                # Handle remove lists
-                if cls.__name__ == 'ConfigRecord':
-                    kwargs[key] = [ConfigItem.from_dict(i) if isinstance(i, dict) else i for i in value]
-                elif cls.__name__ == 'SummaryRecord':
-                    kwargs[key] = [SummaryItem.from_dict(i) if isinstance(i, dict) else i for i in value]
-                else:
-                    kwargs[key] = value
-            elif key == 'contents' and isinstance(value, list):
-                # Handle artifact manifest contents
-                kwargs[key] = [ArtifactManifestEntry.from_dict(i) if isinstance(i, dict) else i for i in value]
-            else:
-                kwargs[key] = value
-        return cls(**kwargs)
+        build = _from_dict_builders.get(cls)
+        if build is None:
+            build = _from_dict_builders[cls] = _make_from_dict(cls)
+        return build(data)
+
+
+@dataclass
+class EmptyModel(BaseModel):
+    """Base class for models without fields.
+    
+    Such models carry no state, so each class hands out a single shared
+    instance instead of allocating a new one per message.
+    """
+    
+    def __new__(cls, *args, **kwargs):
+        instance = cls.__dict__.get("_instance")
+        if instance is None:
+            instance = super().__new__(cls)
+            cls._instance = instance
+        return instance
+
+
+# Generated ``to_dict``/``from_dict`` builders, keyed by class. Built lazily
+# on first use: dataclass fields only exist once the @dataclass decorator has
+# run, and several records (e.g. Record, Request) only resolve their forward
+# references after the defining module has finished importing.
+_to_dict_builders: Dict[type, Callable[[Any], dict]] = {}
+_from_dict_builders: Dict[type, Callable[[dict], Any]] = {}
+
+# Field types whose values are already JSON-compatible
+_SCALAR_TYPES = (str, int, float, bool)
+
+
+def _convert(obj: Any) -> Any:
+    """Convert a field value to its JSON-compatible form."""
+    if isinstance(obj, BaseModel):
+        return obj.to_dict()
+    elif isinstance(obj, Enum):
+        return obj.value
+    elif isinstance(obj, list):
+        return [_convert(item) for item in obj]
+    elif isinstance(obj, dict):
+        return {k: _convert(v) for k, v in obj.items()}
+    elif isinstance(obj, datetime):
+        return obj.isoformat()
+    else:
+        return obj
+
+
+def _parse_datetime(value: str) -> Optional[datetime]:
+    """Parse an ISO timestamp, returning None if it is malformed."""
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return None
+
+
+def _unwrap_optional(tp: Any) -> Any:
+    """Return ``X`` for ``Optional[X]``, otherwise ``tp`` unchanged."""
+    if get_origin(tp) is Union:
+        args = [arg for arg in get_args(tp) if arg is not type(None)]
+        if len(args) == 1:
+            return args[0]
+    return tp
+
+
+def _make_to_dict(cls: type) -> Callable[[Any], dict]:
+    """Generate a ``to_dict`` method specialised for ``cls``.
+
+    None fields are skipped. Scalar fields and lists of scalars are copied
+    directly; any other value goes through ``_convert``.
+    """
+    hints = get_type_hints(cls)
+    namespace: Dict[str, Any] = {"_convert": _convert}
+    lines = ["def to_dict(self):", "    data = {}"]
+
+    for f in fields(cls):
+        tp = _unwrap_optional(hints.get(f.name, f.type))
+        name = f.name
+        if tp in _SCALAR_TYPES:
+            value = "v"
+        elif get_origin(tp) is list and get_args(tp) and get_args(tp)[0] in _SCALAR_TYPES:
+            value = "list(v)"
+        else:
+            value = "_convert(v)"
+        lines += [
+            f"    v = self.{name}",
+            "    if v is not None:",
+            f"        data[{name!r}] = {value}",
+        ]
+
+    lines.append("    return data")
+    exec("\n".join(lines), namespace)
+    return namespace["to_dict"]
+
+
+def _make_from_dict(cls: type) -> Callable[[dict], Any]:
+    """Generate a ``from_dict`` constructor specialised for ``cls``.
+
+    Field types are resolved once, and only fields that need converting
+    (nested models, lists of models, enums, datetimes) get a line of code;
+    everything else is passed straight through to the constructor.
+    """
+    hints = get_type_hints(cls)
+    namespace: Dict[str, Any] = {"cls": cls, "_parse_datetime": _parse_datetime}
+    lines = ["def from_dict(data):", "    kwargs = dict(data)"]
+
+    for f in fields(cls):
+        tp = _unwrap_optional(hints.get(f.name, f.type))
+        name = f.name
+        if isinstance(tp, type) and issubclass(tp, BaseModel):
+            namespace[f"_t_{name}"] = tp
+            lines += [
+                f"    v = kwargs.get({name!r})",
+                "    if isinstance(v, dict):",
+                f"        kwargs[{name!r}] = _t_{name}.from_dict(v)",
+            ]
+        elif isinstance(tp, type) and issubclass(tp, Enum):
+            namespace[f"_t_{name}"] = tp
+            lines += [
+                f"    v = kwargs.get({name!r})",
+                "    if isinstance(v, str):",
+                f"        kwargs[{name!r}] = _t_{name}(v)",
+            ]
+        elif tp is datetime:
+            lines += [
+                f"    v = kwargs.get({name!r})",
+                "    if isinstance(v, str):",
+                f"        kwargs[{name!r}] = _parse_datetime(v)",
+            ]
+        elif get_origin(tp) is list and get_args(tp):
+            item_tp = get_args(tp)[0]
+            if isinstance(item_tp, type) and issubclass(item_tp, BaseModel):
+                namespace[f"_t_{name}"] = item_tp
+                lines += [
+                    f"    v = kwargs.get({name!r})",
+                    "    if isinstance(v, list):",
+                    f"        kwargs[{name!r}] = [_t_{name}.from_dict(i) if isinstance(i, dict) else i for i in v]",
+                ]
+
+    lines.append("    return cls(**kwargs)")
+    exec("\n".join(lines), namespace)
+    return namespace["from_dict"]
 
 
 @dataclass
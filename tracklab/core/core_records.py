@@ -8,11 +8,28 @@ from dataclasses import dataclass, field
 from typing import Dict, Any, Optional, List
 from datetime import datetime
 import json
+import math
 import uuid as uuid_lib
 
 from .base_models import BaseModel, RecordInfo, StatsType, OutputType, RecordType
 
 
+def _value_json(value: Any) -> str:
+    """Encode an item value as JSON text.
+    
+    Plain ints and finite floats, by far the most common metric values,
+    are formatted directly; their repr is exactly what ``json.dumps``
+    would produce. NumPy scalars and arrays are converted to Python
+    values first, since the json module cannot encode them.
+    """
+    tp = type(value)
+    if tp is int or (tp is float and math.isfinite(value)):
+        return repr(value)
+    if tp.__module__ == "numpy" and hasattr(value, "tolist"):
+        value = value.tolist()
+    return json.dumps(value)
+
+
 @dataclass
 class HistoryItem(BaseModel):
     """History item (metric value)."""
@@ -28,7 +45,7 @@ class HistoryItem(BaseModel):
     
     def set_value(self, value: Any):
         """Set the value."""
-        self.value_json = json.dumps(value)
+        self.value_json = _value_json(value)
 
 
 @dataclass
@@ -66,7 +83,7 @@ class ConfigItem(BaseModel):
     
     def set_value(self, value: Any):
         """Set the value."""
-        self.value_json = json.dumps(value)
+        self.value_json = _value_json(value)
 
 
 @dataclass
@@ -92,7 +109,7 @@ class SummaryItem(BaseModel):
     
     def set_value(self, value: Any):
         """Set the value."""
-        self.value_json = json.dumps(value)
+        self.value_json = _value_json(value)
 
 
 @dataclass
@@ -134,7 +151,7 @@ class SettingsItem(BaseModel):
     
     def set_value(self, value: Any):
         """Set the value."""
-        self.value_json = json.dumps(value)
+        self.value_json = _value_json(value)
 
 
 @dataclass
@@ -171,20 +188,6 @@ class RunRecord(BaseModel):
             self.run_id = str(uuid_lib.uuid4())[:8]
         if self.start_time is None:
             self.start_time = datetime.now()
-    
-    @classmethod
-    def from_dict(cls, data: dict):
-        """Create instance from dictionary with datetime parsing."""
-        # Handle datetime fields
-        if 'start_time' in data:
-            if isinstance(data['start_time'], str):
-                try:
-                    data['start_time'] = datetime.fromisoformat(data['start_time'])
-                except:
-                    data['start_time'] = None
-        
-        # Call parent from_dict
-        return super().from_dict(data)
 
 
 # Artifact classes removed for local-only TrackLab
@@ -241,7 +244,7 @@ class StatsItem(BaseModel):
     
     def set_value(self, value: Any):
         """Set the value."""
-        self.value_json = json.dumps(value)
+        self.value_json = _value_json(value)
 
 
 @dataclass
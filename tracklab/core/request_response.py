@@ -7,7 +7,7 @@ between different components of TrackLab.
 from dataclasses import dataclass, field
 from typing import Dict, Any, Optional
 
-from .base_models import BaseModel
+from .base_models import BaseModel, EmptyModel
 
 
 @dataclass
@@ -70,122 +70,122 @@ class Response(BaseModel):
 
 
 @dataclass
-class Result(BaseModel):
+class Result(EmptyModel):
     """Result type for responses."""
     pass
 
 
 # Only include request/response types that are actually used
 @dataclass
-class StatusRequest(BaseModel):
+class StatusRequest(EmptyModel):
     """Status request."""
     pass
 
 
 @dataclass
-class HeaderRecord(BaseModel):
+class HeaderRecord(EmptyModel):
     """Header record for run initialization."""
     pass
 
 
 @dataclass
-class CancelRequest(BaseModel):
+class CancelRequest(EmptyModel):
     """Cancel request."""
     pass
 
 
 @dataclass
-class PartialHistoryRequest(BaseModel):
+class PartialHistoryRequest(EmptyModel):
     """Partial history request."""
     pass
 
 
 @dataclass
-class TBRecord(BaseModel):
+class TBRecord(EmptyModel):
     """TensorBoard record."""
     pass
 
 
 @dataclass
-class RunPreemptingRecord(BaseModel):
+class RunPreemptingRecord(EmptyModel):
     """Run preempting record."""
     pass
 
 
 @dataclass
-class EnvironmentRecord(BaseModel):
+class EnvironmentRecord(EmptyModel):
     """Environment record."""
     pass
 
 
 @dataclass
-class JobInputRequest(BaseModel):
+class JobInputRequest(EmptyModel):
     """Job input request."""
     pass
 
 
 @dataclass
-class GetSummaryRequest(BaseModel):
+class GetSummaryRequest(EmptyModel):
     """Get summary request."""
     pass
 
 
 @dataclass
-class PauseRequest(BaseModel):
+class PauseRequest(EmptyModel):
     """Pause request."""
     pass
 
 
 @dataclass
-class ResumeRequest(BaseModel):
+class ResumeRequest(EmptyModel):
     """Resume request."""
     pass
 
 
 @dataclass
-class StopStatusRequest(BaseModel):
+class StopStatusRequest(EmptyModel):
     """Stop status request."""
     pass
 
 
 @dataclass
-class InternalMessagesRequest(BaseModel):
+class InternalMessagesRequest(EmptyModel):
     """Internal messages request."""
     pass
 
 
 @dataclass
-class NetworkStatusRequest(BaseModel):
+class NetworkStatusRequest(EmptyModel):
     """Network status request."""
     pass
 
 
 @dataclass
-class OperationStatsRequest(BaseModel):
+class OperationStatsRequest(EmptyModel):
     """Operation stats request."""
     pass
 
 
 @dataclass
-class PollExitRequest(BaseModel):
+class PollExitRequest(EmptyModel):
     """Poll exit request."""
     pass
 
 
 @dataclass
-class SampledHistoryRequest(BaseModel):
+class SampledHistoryRequest(EmptyModel):
     """Sampled history request."""
     pass
 
 
 @dataclass
-class RunStartRequest(BaseModel):
+class RunStartRequest(EmptyModel):
     """Run start request."""
     pass
 
 
 @dataclass
-class CheckVersionRequest(BaseModel):
+class CheckVersionRequest(EmptyModel):
     """Check version request."""
     pass
 
@@ -193,115 +193,115 @@ class CheckVersionRequest(BaseModel):
 
 
 @dataclass
-class DeferRequest(BaseModel):
+class DeferRequest(EmptyModel):
     """Defer request."""
     pass
 
 
 @dataclass
-class AttachRequest(BaseModel):
+class AttachRequest(EmptyModel):
     """Attach request."""
     pass
 
 
 @dataclass
-class ServerInfoRequest(BaseModel):
+class ServerInfoRequest(EmptyModel):
     """Server info request."""
     pass
 
 
 @dataclass
-class KeepaliveRequest(BaseModel):
+class KeepaliveRequest(EmptyModel):
     """Keepalive request."""
     pass
 
 
 @dataclass
-class RunStatusRequest(BaseModel):
+class RunStatusRequest(EmptyModel):
     """Run status request."""
     pass
 
 
 @dataclass
-class SenderMarkRequest(BaseModel):
+class SenderMarkRequest(EmptyModel):
     """Sender mark request."""
     pass
 
 
 @dataclass
-class SenderReadRequest(BaseModel):
+class SenderReadRequest(EmptyModel):
     """Sender read request."""
     pass
 
 
 @dataclass
-class SyncFinishRequest(BaseModel):
+class SyncFinishRequest(EmptyModel):
     """Sync finish request."""
     pass
 
 
 @dataclass
-class StatusReportRequest(BaseModel):
+class StatusReportRequest(EmptyModel):
     """Status report request."""
     pass
 
 
 @dataclass
-class SummaryRecordRequest(BaseModel):
+class SummaryRecordRequest(EmptyModel):
     """Summary record request."""
     pass
 
 
 @dataclass
-class TelemetryRecordRequest(BaseModel):
+class TelemetryRecordRequest(EmptyModel):
     """Telemetry record request."""
     pass
 
 
 @dataclass
-class GetSystemMetricsRequest(BaseModel):
+class GetSystemMetricsRequest(EmptyModel):
     """Get system metrics request."""
     pass
 
 
 @dataclass
-class PythonPackagesRequest(BaseModel):
+class PythonPackagesRequest(EmptyModel):
     """Python packages request."""
     pass
 
 
 @dataclass
-class RunFinishWithoutExitRequest(BaseModel):
+class RunFinishWithoutExitRequest(EmptyModel):
     """Run finish without exit request."""
     pass
 
 
 @dataclass
-class ShutdownRequest(BaseModel):
+class ShutdownRequest(EmptyModel):
     """Shutdown request."""
     pass
 
 
 @dataclass
-class RunExitRecord(BaseModel):
+class RunExitRecord(EmptyModel):
     """Run exit record."""
     pass
 
 
 @dataclass
-class AlertRecord(BaseModel):
+class AlertRecord(EmptyModel):
     """Alert record."""
     pass
 
 
 @dataclass
-class FinalRecord(BaseModel):
+class FinalRecord(EmptyModel):
     """Final record."""
     pass
 
 
 @dataclass
-class FooterRecord(BaseModel):
+class FooterRecord(EmptyModel):
     """Footer record."""
     pass
 
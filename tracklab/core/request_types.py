@@ -2,7 +2,7 @@
 
 from dataclasses import dataclass
 from typing import Optional, List, Dict, Any
-from .base_models import BaseModel
+from .base_models import BaseModel, EmptyModel
 
 
 @dataclass 
@@ -12,61 +12,61 @@ class CancelRequest(BaseModel):
 
 
 @dataclass
-class DeferRequest(BaseModel):
+class DeferRequest(EmptyModel):
     """Defer request."""
     pass
 
 
 @dataclass
-class FinalRecord(BaseModel):
+class FinalRecord(EmptyModel):
     """Final record."""
     pass
 
 
 @dataclass
-class FooterRecord(BaseModel):
+class FooterRecord(EmptyModel):
     """Footer record."""
     pass
 
 
 @dataclass
-class SenderMarkRequest(BaseModel):
+class SenderMarkRequest(EmptyModel):
     """Sender mark request."""
     pass
 
 
 @dataclass
-class SenderReadRequest(BaseModel):
+class SenderReadRequest(EmptyModel):
     """Sender read request."""
     pass
 
 
 @dataclass
-class ShutdownRequest(BaseModel):
+class ShutdownRequest(EmptyModel):
     """Shutdown request."""
     pass
 
 
 @dataclass
-class StatusReportRequest(BaseModel):
+class StatusReportRequest(EmptyModel):
     """Status report request."""
     pass
 
 
 @dataclass
-class SummaryRecordRequest(BaseModel):
+class SummaryRecordRequest(EmptyModel):
     """Summary record request."""
     pass
 
 
 @dataclass
-class TelemetryRecordRequest(BaseModel):
+class TelemetryRecordRequest(EmptyModel):
     """Telemetry record request."""
     pass
 
 
 @dataclass
-class PythonPackagesRequest(BaseModel):
+class PythonPackagesRequest(EmptyModel):
     """Python packages request."""
     pass
 
@@ -1,25 +1,146 @@
 """Storage layer using LevelDB to replace protobuf-based storage."""
 
+import itertools
 import json
+import math
 import os
 import plyvel
+import sys
 import time
 import threading
-from typing import Dict, Any, Optional, List, Iterator, Union
+from typing import Dict, Any, Optional, List, Iterable, Iterator, Tuple, Union
 from pathlib import Path
 from contextlib import contextmanager
 import logging
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from .core_records import (
     Record, RunRecord, HistoryRecord, ConfigRecord,
     SummaryRecord, MetricRecord,
-    StatsRecord, OutputRecord, HistoryStep,
-    ConfigItem, SummaryItem
+    StatsRecord, OutputRecord, HistoryStep, HistoryItem,
+    ConfigItem, SummaryItem, _value_json
 )
 from .base_models import RecordType
 
 logger = logging.getLogger(__name__)
 
+# LevelDB options shared by the records and metadata databases. Bloom
+# filters let point lookups that miss (e.g. an unindexed run ID) skip the
+# sstables entirely; larger blocks suit the prefix scans used everywhere.
+_DB_OPTS = dict(
+    create_if_missing=True,
+    bloom_filter_bits=10,
+    block_size=64 * 1024,
+    write_buffer_size=64 * 1024 * 1024,
+    max_open_files=1000,
+    compression="snappy",
+)
+
+# Metadata key holding the highest record sequence number reserved so far
+_WRITE_SEQ_KEY = b"write_seq"
+
+# Sequence numbers are reserved in blocks of this size, so the high-water
+# mark is persisted once per block rather than with every write
+_SEQ_BLOCK = 1024
+
+# Metadata keys marking that the research/experiment indices and the
+# per-run history index are populated
+_RUN_INDICES_KEY = b"indexed:runs"
+_HISTORY_INDEX_KEY = b"indexed:history"
+
+# Record key prefix for each record type
+_TYPE_PREFIXES = {rt: f"{rt.value}:".encode() for rt in RecordType}
+_HISTORY_PREFIX = _TYPE_PREFIXES[RecordType.HISTORY]
+
+# History steps are indexed as step + _STEP_OFFSET, zero-padded to 20 digits,
+# so keys sort in step order across the whole signed 64-bit range
+_MIN_STEP = -(2 ** 63)
+_MAX_STEP = 2 ** 63 - 1
+_STEP_OFFSET = 2 ** 63
+
+# Separates the components of composite index keys, since research and
+# experiment names may themselves contain ':'
+_SEP = "\x00"
+
+
+if orjson is not None:
+    def _dumps(obj: Any) -> bytes:
+        # orjson writes NaN/Infinity as null and rejects integers wider than
+        # 64 bits; encode such records with the json module instead, so the
+        # stored data does not depend on whether orjson is installed. A real
+        # None is written as null by both, so re-encoding it is harmless.
+        try:
+            data = orjson.dumps(obj)
+        except TypeError:
+            return json.dumps(obj).encode()
+        if b"null" in data:
+            return json.dumps(obj).encode()
+        return data
+else:
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
+
+def _loads(data: bytes) -> Any:
+    # Always the json module: orjson rejects NaN/Infinity and silently turns
+    # integers wider than 64 bits into floats
+    return json.loads(data)
+
+
+def _check_step(step: Any) -> int:
+    """Validate a history step number.
+    
+    Args:
+        step: Step number; an integral float such as 2.0 is accepted
+        
+    Returns:
+        The step as an int
+        
+    Raises:
+        ValueError: If the step is not an integer in the signed 64-bit range
+    """
+    number = int(step)
+    if number != step or not _MIN_STEP <= number <= _MAX_STEP:
+        raise ValueError(f"History step must be a 64-bit integer, got {step!r}")
+    return number
+
+
+def _history_step(record: Record) -> int:
+    """Get the step number of a history record."""
+    history = record.history
+    return _check_step(history.step.num) if history and history.step else 0
+
+
+def _intern_strings(record: Record):
+    """Intern the strings a record shares with many other records.
+    
+    Metric/config/summary keys and research/experiment names repeat across
+    every record of a run, so decoded records share one copy of each.
+    """
+    intern = sys.intern
+    # Keys and names may be null or non-string in stored rows; only strings
+    # can be interned
+    if record.history:
+        items = record.history.item
+    elif record.config or record.summary:
+        changes = record.config or record.summary
+        items = itertools.chain(changes.update, changes.remove)
+    else:
+        items = ()
+    for item in items:
+        if isinstance(item.key, str):
+            item.key = intern(item.key)
+    if record.run:
+        run = record.run
+        if isinstance(run.research_name, str):
+            run.research_name = intern(run.research_name)
+        if isinstance(run.experiment_name, str):
+            run.experiment_name = intern(run.experiment_name)
+
 
 class DataStore:
     """Data store using LevelDB for persistence."""
@@ -34,13 +155,114 @@ class DataStore:
         self.db_path.mkdir(parents=True, exist_ok=True)
         
         # Main database for records
-        self.db = plyvel.DB(str(self.db_path / "records"), create_if_missing=True)
+        self.db = plyvel.DB(str(self.db_path / "records"), **_DB_OPTS)
         
         # Metadata database
-        self.meta_db = plyvel.DB(str(self.db_path / "metadata"), create_if_missing=True)
+        self.meta_db = plyvel.DB(str(self.db_path / "metadata"), **_DB_OPTS)
+        
+        # Sequence numbers come from a lock-free counter; the lock only
+        # guards reserving the next block of them
+        self._seq_lock = threading.Lock()
+        self._seq_reserved = self._load_write_seq()
+        self._seq = itertools.count(self._seq_reserved + 1)
+        
+        self._ensure_run_indices()
+        self._ensure_history_index()
+    
+    def _load_write_seq(self) -> int:
+        """Restore the write sequence so keys stay unique across sessions.
+        
+        Returns:
+            The highest sequence number that may already be in use
+        """
+        seq = self.meta_db.get(_WRITE_SEQ_KEY)
+        if seq is not None:
+            return int(seq)
+        
+        # Databases written before the sequence was persisted: resume after
+        # the highest sequence number found in the record keys, and persist
+        # it so later opens (including read-only ones) skip the scan.
+        last = 0
+        for key in self.db.iterator(include_value=False):
+            tail = key.rsplit(b":", 1)[-1]
+            if tail.isdigit():
+                last = max(last, int(tail))
+        self.meta_db.put(_WRITE_SEQ_KEY, b"%d" % last)
+        return last
+    
+    def _ensure_run_indices(self):
+        """Build the research/experiment indices for older databases."""
+        if self.meta_db.get(_RUN_INDICES_KEY) is not None:
+            return
         
-        self._lock = threading.Lock()
-        self._write_seq = 0
+        with self.meta_db.write_batch(transaction=True) as meta_wb:
+            for key, value in self.db.iterator(prefix=_TYPE_PREFIXES[RecordType.RUN]):
+                try:
+                    record = self._decode_record(value)
+                except Exception as e:
+                    logger.error(f"Error reading record {key.decode()}: {e}")
+                    continue
+                self._update_indices(record, key, meta_wb)
+            meta_wb.put(_RUN_INDICES_KEY, b"")
+    
+    def _ensure_history_index(self):
+        """Build the per-run history index for older databases."""
+        if self.meta_db.get(_HISTORY_INDEX_KEY) is not None:
+            return
+        
+        prefix = b"run_records:"
+        with self.meta_db.write_batch(transaction=True) as meta_wb:
+            for key, value in self.meta_db.iterator(prefix=prefix):
+                name = key[len(prefix):]
+                if value.startswith(b"["):
+                    # Legacy index: the whole run as one JSON list
+                    run_id = name.decode()
+                    record_keys = [k.encode() for k in _loads(value)]
+                else:
+                    run_id = name.rsplit(_SEP.encode(), 1)[0].decode()
+                    record_keys = [value]
+                
+                for record_key in record_keys:
+                    if not record_key.startswith(_HISTORY_PREFIX):
+                        continue
+                    record = self.read_record(record_key)
+                    if record is None:
+                        continue
+                    try:
+                        step = _history_step(record)
+                    except ValueError as e:
+                        logger.warning(f"Not indexing history record {record_key.decode()}: {e}")
+                        continue
+                    seq = int(record_key.rsplit(b":", 1)[1])
+                    self._add_to_history_index(run_id, step, seq, record_key, meta_wb)
+            meta_wb.put(_HISTORY_INDEX_KEY, b"")
+    
+    def _next_seq(self) -> int:
+        """Allocate the next record sequence number."""
+        seq = next(self._seq)
+        if seq > self._seq_reserved:
+            with self._seq_lock:
+                if seq > self._seq_reserved:
+                    # Persist before the number is used, so a reopened
+                    # store never hands it out again
+                    reserved = seq + _SEQ_BLOCK - 1
+                    self.meta_db.put(_WRITE_SEQ_KEY, b"%d" % reserved)
+                    self._seq_reserved = reserved
+        return seq
+    
+    def _encode_record(self, record: Record) -> bytes:
+        """Serialize a record for storage.
+        
+        Records are always stored as JSON, so any environment can read the
+        store whether or not the optional ``perf`` dependency is installed.
+        """
+        return _dumps(record.to_dict())
+    
+    def _decode_record(self, value: bytes) -> Record:
+        """Deserialize a stored record."""
+        record = Record.from_dict(_loads(value))
+        _intern_strings(record)
+        return record
         
     def write_record(self, record: Record) -> str:
         """Write a record to storage.
@@ -51,41 +273,67 @@ class DataStore:
         Returns:
             Record key
         """
-        with self._lock:
-            self._write_seq += 1
-            
-            # Generate key based on record type and sequence
-            if record.record_type == RecordType.HISTORY:
-                # History records use step number as part of key
-                step = record.history.step.num if record.history and record.history.step else 0
-                key = f"history:{record.num}:{step}:{self._write_seq}"
-            else:
-                key = f"{record.record_type.value}:{record.num}:{self._write_seq}"
-            
-            # Write to database
-            value = record.to_json()
-            self.db.put(key.encode(), value.encode())
-            
-            # Update indices
-            self._update_indices(record, key)
+        return self.write_records([record])[0]
+    
+    def write_records(self,
+                      records: List[Record],
+                      run_id: Optional[str] = None) -> List[str]:
+        """Write several records in a single LevelDB batch.
+        
+        Args:
+            records: Records to write
+            run_id: If given, the records are also added to this run's index
             
-            return key
+        Returns:
+            Record keys, in the same order as ``records``
+        """
+        seqs = []
+        keys = []
+        # Both batches are filled before either is committed, so a record
+        # that fails to encode or index leaves nothing behind. The records
+        # batch (inner) commits first, so index entries never point at rows
+        # that were not written. Index entries are either unique per record
+        # or idempotent, so concurrent writers need no lock around them.
+        with self.meta_db.write_batch(transaction=True) as meta_wb, \
+                self.db.write_batch(transaction=True) as wb:
+            for record in records:
+                seq = self._next_seq()
+                key = self._record_key(record, seq)
+                wb.put(key, self._encode_record(record))
+                self._update_indices(record, key, meta_wb)
+                seqs.append(seq)
+                keys.append(key)
+            if run_id is not None:
+                self._add_to_run_index(run_id, zip(seqs, keys, records), meta_wb)
+        
+        return [key.decode() for key in keys]
+    
+    @staticmethod
+    def _record_key(record: Record, seq: int) -> bytes:
+        """Generate the storage key for a record."""
+        if record.record_type is RecordType.HISTORY:
+            # History records use step number as part of key
+            return b"%b%d:%d:%d" % (_HISTORY_PREFIX, record.num, _history_step(record), seq)
+        return b"%b%d:%d" % (_TYPE_PREFIXES[record.record_type], record.num, seq)
     
-    def read_record(self, key: str) -> Optional[Record]:
+    def read_record(self, key: Union[str, bytes]) -> Optional[Record]:
         """Read a record by key.
         
         Args:
-            key: Record key
+            key: Record key, as text or as the raw LevelDB key
             
         Returns:
             Record or None if not found
         """
-        try:
-            value = self.db.get(key.encode())
-            data = json.loads(value.decode())
-            return Record.from_dict(data)
-        except KeyError:
+        if isinstance(key, str):
+            key = key.encode()
+        
+        value = self.db.get(key)
+        if value is None:
             return None
+        
+        try:
+            return self._decode_record(value)
         except Exception as e:
             logger.error(f"Error reading record {key}: {e}")
             return None
@@ -104,27 +352,24 @@ class DataStore:
         Yields:
             Records matching criteria
         """
-        prefix = f"{record_type.value}:" if record_type else ""
-        start = (prefix + start_key).encode()
+        prefix = _TYPE_PREFIXES[record_type] if record_type else b""
+        start = prefix + start_key.encode()
+        # Keys of one record type all lie below "<type>;" (';' follows ':')
+        stop = prefix[:-1] + b";" if prefix else None
         
+        decode = self._decode_record
         count = 0
-        for key, value in self.db.iterator(start=start):
-            key_str = key.decode()
-            
-            # Check prefix
-            if prefix and not key_str.startswith(prefix):
-                break
-                
+        for key, value in self.db.iterator(start=start, stop=stop):
             if count >= limit:
                 break
                 
             try:
-                data = json.loads(value.decode())
-                record = Record.from_dict(data)
-                yield record
-                count += 1
+                record = decode(value)
             except Exception as e:
-                logger.error(f"Error reading record {key_str}: {e}")
+                logger.error(f"Error reading record {key.decode()}: {e}")
+                continue
+            yield record
+            count += 1
     
     def write_run_record(self, run: RunRecord) -> str:
         """Write a run record.
@@ -152,20 +397,16 @@ class DataStore:
             Run record or None
         """
         # Check index
-        try:
-            key_bytes = self.meta_db.get(f"run:{run_id}".encode())
-            if key_bytes:
-                key = key_bytes.decode()
-            else:
-                raise KeyError()
+        key = self.meta_db.get(f"run:{run_id}".encode())
+        if key:
             record = self.read_record(key)
             return record.run if record else None
-        except KeyError:
-            # Scan for run
-            for record in self.scan_records(RecordType.RUN):
-                if record.run and record.run.run_id == run_id:
-                    return record.run
-            return None
+        
+        # Scan for run
+        for record in self.scan_records(RecordType.RUN):
+            if record.run and record.run.run_id == run_id:
+                return record.run
+        return None
     
     def write_history(self, 
                      run_id: str,
@@ -181,11 +422,12 @@ class DataStore:
         Returns:
             Record key
         """
-        history = HistoryRecord()
-        history.step = HistoryStep(num=step)
-        
-        for key, value in items.items():
-            history.add_item(key, value)
+        # Steps are stored as integers in keys and the history index
+        step = _check_step(step)
+        history = HistoryRecord(
+            item=[HistoryItem(key=key, value_json=_value_json(value)) for key, value in items.items()],
+            step=HistoryStep(num=step),
+        )
         
         record = Record(
             num=step,
@@ -193,12 +435,7 @@ class DataStore:
             history=history
         )
         
-        key = self.write_record(record)
-        
-        # Update run index
-        self._add_to_run_index(run_id, key)
-        
-        return key
+        return self.write_records([record], run_id)[0]
     
     def get_history(self, 
                    run_id: str,
@@ -216,21 +453,24 @@ class DataStore:
         """
         history_records = []
         
-        # Get records from run index
-        run_keys = self._get_run_records(run_id)
-        
-        for key in run_keys:
-            if not key.startswith("history:"):
+        # The history index is ordered by step, so the range can be read
+        # directly without sorting afterwards
+        prefix = f"run_history:{run_id}{_SEP}".encode()
+        first = min(max(math.ceil(min_step), _MIN_STEP), _MAX_STEP + 1)
+        start = prefix + b"%020d" % (first + _STEP_OFFSET)
+        stop = prefix[:-1] + b"\x01"
+        
+        sep = _SEP.encode()
+        for key, record_key in self.meta_db.iterator(start=start, stop=stop):
+            step = int(key[len(prefix):].split(sep, 1)[0]) - _STEP_OFFSET
+            if max_step is not None and step > max_step:
+                break
+            if step < min_step:
                 continue
-                
-            record = self.read_record(key)
+            
+            record = self.read_record(record_key)
             if record and record.history:
-                step = record.history.step.num if record.history.step else 0
-                if step >= min_step and (max_step is None or step <= max_step):
-                    history_records.append(record.history)
-        
-        # Sort by step
-        history_records.sort(key=lambda h: h.step.num if h.step else 0)
+                history_records.append(record.history)
         
         return history_records
     
@@ -257,10 +497,7 @@ class DataStore:
             config=config_record
         )
         
-        key = self.write_record(record)
-        self._add_to_run_index(run_id, key)
-        
-        return key
+        return self.write_records([record], run_id)[0]
     
     def write_summary(self, run_id: str, summary: Dict[str, Any]) -> str:
         """Write summary.
@@ -285,50 +522,138 @@ class DataStore:
             summary=summary_record
         )
         
-        key = self.write_record(record)
-        self._add_to_run_index(run_id, key)
-        
-        return key
+        return self.write_records([record], run_id)[0]
     
-    def _update_indices(self, record: Record, key: str):
+    def _update_indices(self, record: Record, key: bytes, meta_wb):
         """Update indices for a record."""
+        if record.record_type != RecordType.RUN or not record.run:
+            return
+        
+        run = record.run
+        
         # Index runs by ID
-        if record.record_type == RecordType.RUN and record.run:
-            self.meta_db.put(
-                f"run:{record.run.run_id}".encode(),
-                key.encode()
+        meta_wb.put(f"run:{run.run_id}".encode(), key)
+        
+        # Index research and experiment names, and runs by start time
+        if run.research_name:
+            meta_wb.put(f"research:{run.research_name}".encode(), b"")
+        if run.experiment_name:
+            meta_wb.put(
+                f"exp:{run.research_name}{_SEP}{run.experiment_name}".encode(),
+                b""
             )
+        start_time = run.start_time.isoformat() if run.start_time else ""
+        meta_wb.put(
+            f"run_by_time:{run.research_name}{_SEP}{run.experiment_name}"
+            f"{_SEP}{start_time}{_SEP}{run.run_id}".encode(),
+            key
+        )
     
-    def _add_to_run_index(self, run_id: str, record_key: str):
-        """Add a record to run index."""
-        index_key = f"run_records:{run_id}"
+    def list_research_names(self) -> List[str]:
+        """List all research names, in sorted order.
         
-        try:
-            existing_bytes = self.meta_db.get(index_key.encode())
-            if existing_bytes:
-                existing = existing_bytes.decode()
-            else:
-                raise KeyError()
-            keys = json.loads(existing)
-        except KeyError:
-            keys = []
-        
-        keys.append(record_key)
-        self.meta_db.put(index_key.encode(), json.dumps(keys).encode())
+        Returns:
+            Research names
+        """
+        prefix = b"research:"
+        return [
+            key[len(prefix):].decode()
+            for key in self.meta_db.iterator(prefix=prefix, include_value=False)
+        ]
+    
+    def list_experiment_names(self, research_name: str) -> List[str]:
+        """List all experiment names of a research, in sorted order.
+        
+        Args:
+            research_name: Research name
+            
+        Returns:
+            Experiment names
+        """
+        prefix = f"exp:{research_name}{_SEP}".encode()
+        return [
+            key[len(prefix):].decode()
+            for key in self.meta_db.iterator(prefix=prefix, include_value=False)
+        ]
+    
+    def iter_runs_by_time(self,
+                          research_name: Optional[str] = None,
+                          experiment_name: Optional[str] = None,
+                          reverse: bool = False) -> Iterator[Tuple[str, str]]:
+        """Iterate run record keys from the run_by_time index.
+        
+        Entries are ordered by research, experiment and then start time,
+        so runs of a single experiment come out in start time order.
+        
+        Args:
+            research_name: Only include runs of this research
+            experiment_name: Only include runs of this experiment
+            reverse: Iterate in descending key order
+            
+        Yields:
+            (start_time, record_key) tuples; start_time is an ISO timestamp,
+            or "" for runs without one
+        """
+        prefix = "run_by_time:"
+        if research_name is not None:
+            prefix += f"{research_name}{_SEP}"
+            if experiment_name is not None:
+                prefix += f"{experiment_name}{_SEP}"
+        # An experiment without a research cannot be expressed as a prefix
+        check_experiment = research_name is None and experiment_name is not None
+        
+        for key, value in self.meta_db.iterator(prefix=prefix.encode(), reverse=reverse):
+            _, experiment, start_time, _ = key[len("run_by_time:"):].decode().split(_SEP)
+            if check_experiment and experiment != experiment_name:
+                continue
+            yield start_time, value.decode()
+    
+    def _add_to_run_index(self,
+                          run_id: str,
+                          entries: Iterable[Tuple[int, bytes, Record]],
+                          meta_wb):
+        r"""Add records to run index.
+        
+        Each record gets its own ``run_records:<run_id>\0<seq>`` entry, so
+        appending never rewrites the existing index. The zero-padded
+        sequence keeps entries in write order under LevelDB's key sort.
+        History records are also added to the run's history index.
+        """
+        prefix = f"run_records:{run_id}{_SEP}".encode()
+        for seq, record_key, record in entries:
+            meta_wb.put(b"%b%012d" % (prefix, seq), record_key)
+            if record.record_type == RecordType.HISTORY:
+                self._add_to_history_index(
+                    run_id, _history_step(record), seq, record_key, meta_wb
+                )
+    
+    @staticmethod
+    def _add_to_history_index(run_id: str, step: int, seq: int, record_key: bytes, meta_wb):
+        r"""Add a history record to its run's history index.
+        
+        Entries are keyed ``run_history:<run_id>\0<step>\0<seq>`` with
+        zero-padded numbers, so they sort by step and then write order.
+        The step is offset by ``_STEP_OFFSET`` so negative steps sort first.
+        """
+        meta_wb.put(
+            f"run_history:{run_id}{_SEP}{step + _STEP_OFFSET:020d}{_SEP}{seq:012d}".encode(),
+            record_key
+        )
     
     def _get_run_records(self, run_id: str) -> List[str]:
         """Get all record keys for a run."""
-        index_key = f"run_records:{run_id}"
+        return [key.decode() for key in self._run_record_keys(run_id)]
+    
+    def _run_record_keys(self, run_id: str) -> List[bytes]:
+        """Get all raw record keys for a run, in write order."""
+        index_key = f"run_records:{run_id}".encode()
         
-        try:
-            data_bytes = self.meta_db.get(index_key.encode())
-            if data_bytes:
-                data = data_bytes.decode()
-            else:
-                raise KeyError()
-            return json.loads(data)
-        except KeyError:
-            return []
+        # Older databases kept the whole index as one JSON list
+        legacy = self.meta_db.get(index_key)
+        keys = [key.encode() for key in _loads(legacy)] if legacy else []
+        
+        keys.extend(self.meta_db.iterator(prefix=index_key + _SEP.encode(), include_key=False))
+        return keys
     
     def close(self):
         """Close the data store."""
@@ -336,6 +661,11 @@ class DataStore:
         self.meta_db.close()
 
 
+# Default database directory when TRACKLAB_DATA_DIR is not set. Resolved
+# once; the environment variable is still read per call so it can be
+# changed at runtime.
+_HOME_DB_PATH = os.path.expanduser("~/.tracklab")
+
 # Global data store instance
 _global_data_store: Optional[DataStore] = None
 _data_store_lock = threading.Lock()
@@ -355,7 +685,7 @@ def get_data_store(db_path: str = None, force_new: bool = False) -> DataStore:
     
     # 如果没有指定路径，检查环境变量或使用默认的 ~/.tracklab
     if db_path is None:
-        db_path = os.environ.get("TRACKLAB_DATA_DIR", os.path.expanduser("~/.tracklab"))
+        db_path = os.environ.get("TRACKLAB_DATA_DIR", _HOME_DB_PATH)
     
     if force_new:
         with _data_store_lock:
@@ -384,7 +714,7 @@ def data_store_context(db_path: str = None):
         DataStore instance
     """
     if db_path is None:
-        db_path = os.environ.get("TRACKLAB_DATA_DIR", os.path.expanduser("~/.tracklab"))
+        db_path = os.environ.get("TRACKLAB_DATA_DIR", _HOME_DB_PATH)
     store = DataStore(db_path)
     try:
         yield store
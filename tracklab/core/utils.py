@@ -4,10 +4,9 @@ This module provides functions for managing the research → experiment → run
 in local-only TrackLab without requiring the APIs module.
 """
 
-from typing import List, Tuple, Optional, Set
+from typing import List, Tuple, Optional
 from .storage import DataStore
 from .core_records import RunRecord
-from .base_models import RecordType
 
 
 def parse_research_path(path: str) -> Tuple[str, str]:
@@ -47,14 +46,7 @@ def list_researches(data_store: DataStore) -> List[str]:
     Returns:
         List of unique research names
     """
-    research_names: Set[str] = set()
-    
-    # Scan all run records
-    for record in data_store.scan_records(RecordType.RUN):
-        if record.run and record.run.research_name:
-            research_names.add(record.run.research_name)
-    
-    return sorted(list(research_names))
+    return data_store.list_research_names()
 
 
 def list_experiments(data_store: DataStore, research_name: str) -> List[str]:
@@ -67,16 +59,7 @@ def list_experiments(data_store: DataStore, research_name: str) -> List[str]:
     Returns:
         List of unique experiment names
     """
-    experiment_names: Set[str] = set()
-    
-    # Scan run records for this research
-    for record in data_store.scan_records(RecordType.RUN):
-        if (record.run and 
-            record.run.research_name == research_name and 
-            record.run.experiment_name):
-            experiment_names.add(record.run.experiment_name)
-    
-    return sorted(list(experiment_names))
+    return data_store.list_experiment_names(research_name)
 
 
 def get_experiment_runs(
@@ -92,20 +75,17 @@ def get_experiment_runs(
         experiment_name: Name of the experiment
         
     Returns:
-        List of RunRecord objects
+        List of RunRecord objects, most recently started first
     """
     runs = []
     
-    # Scan run records for this experiment
-    for record in data_store.scan_records(RecordType.RUN):
-        if (record.run and 
-            record.run.research_name == research_name and
-            record.run.experiment_name == experiment_name):
+    # The index is ordered by start time, so walking it backwards yields
+    # the newest runs first without sorting
+    for _, key in data_store.iter_runs_by_time(research_name, experiment_name, reverse=True):
+        record = data_store.read_record(key)
+        if record and record.run:
             runs.append(record.run)
     
-    # Sort by start time
-    runs.sort(key=lambda r: r.start_time or "", reverse=True)
-    
     return runs
 
 
@@ -126,36 +106,33 @@ def find_latest_run(
     Returns:
         Most recent RunRecord or None
     """
-    matching_runs = []
-    
-    for record in data_store.scan_records(RecordType.RUN):
-        if not record.run:
-            continue
-            
-        # Apply filters
-        if research_name and record.run.research_name != research_name:
-            continue
-        if experiment_name and record.run.experiment_name != experiment_name:
-            continue
-            
-        matching_runs.append(record.run)
-    
-    if not matching_runs:
+    research_name = research_name or None
+    experiment_name = experiment_name or None
+    
+    if research_name and experiment_name:
+        # Within one experiment the index is in start time order, so the
+        # last entry is the latest run unless none have a timestamp
+        for start_time, key in data_store.iter_runs_by_time(
+            research_name, experiment_name, reverse=True
+        ):
+            if start_time:
+                record = data_store.read_record(key)
+                return record.run if record else None
+            break
+    
+    # Keep the first run with the greatest timestamp; runs without a
+    # timestamp ("") only win if no run has one
+    latest_key = None
+    latest_time = None
+    for start_time, key in data_store.iter_runs_by_time(research_name, experiment_name):
+        if latest_time is None or start_time > latest_time:
+            latest_time, latest_key = start_time, key
+    
+    if latest_key is None:
         return None
     
-    # Separate runs with and without timestamps
-    runs_with_time = [r for r in matching_runs if r.start_time]
-    runs_without_time = [r for r in matching_runs if not r.start_time]
-    
-    # If we have runs with timestamps, return the latest one
-    if runs_with_time:
-        return max(runs_with_time, key=lambda r: r.start_time)
-    
-    # Otherwise return the first run without timestamp
-    if runs_without_time:
-        return runs_without_time[0]
-    
-    return None
+    record = data_store.read_record(latest_key)
+    return record.run if record else None
 
 
 def get_research_summary(data_store: DataStore, research_name: str) -> dict:
@@ -171,9 +148,9 @@ def get_research_summary(data_store: DataStore, research_name: str) -> dict:
     experiments = list_experiments(data_store, research_name)
     total_runs = 0
     
+    # Count index entries; the run records themselves are not needed
     for exp in experiments:
-        runs = get_experiment_runs(data_store, research_name, exp)
-        total_runs += len(runs)
+        total_runs += sum(1 for _ in data_store.iter_runs_by_time(research_name, exp))
     
     return {
         "research_name": research_name,
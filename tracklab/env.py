@@ -12,6 +12,7 @@ from __future__ import annotations
 import json
 import os
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import MutableMapping
 
@@ -143,45 +144,49 @@ _EXECUTABLE = "TRACKLAB_X_EXECUTABLE"
 IGNORE = IGNORE_GLOBS
 
 
-def immutable_keys() -> list[str]:
+# Env keys that shouldn't change within a single process
+_IMMUTABLE_KEYS: tuple[str, ...] = (
+    DIR,
+    ENTITY,
+    PROJECT,
+    API_KEY,
+    IGNORE_GLOBS,
+    DISABLE_CODE,
+    DISABLE_GIT,
+    MODE,
+    ERROR_REPORTING,
+    CRASH_NOSYNC_TIME,
+    MAGIC,
+    USERNAME,
+    USER_EMAIL,
+    SILENT,
+    CONFIG_PATHS,
+    ANONYMOUS,
+    RUN_GROUP,
+    JOB_TYPE,
+    TAGS,
+    RESUME,
+    PROGRAM,
+    AGENT_REPORT_INTERVAL,
+    HTTP_TIMEOUT,
+    HOST,
+    DATA_DIR,
+    ARTIFACT_DIR,
+    ARTIFACT_FETCH_FILE_URL_BATCH_SIZE,
+    CACHE_DIR,
+    DISABLE_SSL,
+    IDENTITY_TOKEN_FILE,
+    CREDENTIALS_FILE,
+)
+
+
+def immutable_keys() -> tuple[str, ...]:
     """These are env keys that shouldn't change within a single process.
 
     We use this to maintain certain values between multiple calls to tracklab.init
     within a single process.
     """
-    return [
-        DIR,
-        ENTITY,
-        PROJECT,
-        API_KEY,
-        IGNORE_GLOBS,
-        DISABLE_CODE,
-        DISABLE_GIT,
-        MODE,
-        ERROR_REPORTING,
-        CRASH_NOSYNC_TIME,
-        MAGIC,
-        USERNAME,
-        USER_EMAIL,
-        SILENT,
-        CONFIG_PATHS,
-        ANONYMOUS,
-        RUN_GROUP,
-        JOB_TYPE,
-        TAGS,
-        RESUME,
-        PROGRAM,
-        AGENT_REPORT_INTERVAL,
-        HTTP_TIMEOUT,
-        HOST,
-        DATA_DIR,
-        ARTIFACT_DIR,
-        ARTIFACT_FETCH_FILE_URL_BATCH_SIZE,
-        CACHE_DIR,
-        DISABLE_SSL,
-        IDENTITY_TOKEN_FILE,
-        CREDENTIALS_FILE,
-    ]
+    return _IMMUTABLE_KEYS
 
 
 # Additional getter functions for backward compatibility
@@ -330,6 +335,16 @@ def _env_as_bool(
     val = env.get(var, default)
     if not isinstance(val, str):
         return False
+    return _str_as_bool(val)
+
+
+@lru_cache(maxsize=128)
+def _str_as_bool(val: str) -> bool:
+    """Parse a boolean env value, caching by the raw string.
+
+    The environment itself is still read on every call, so changes to
+    os.environ are picked up; only the parsing is cached.
+    """
     try:
         return strtobool(val)
     except ValueError:
@@ -8,6 +8,8 @@ If the URLs need to be updates, use the dub.co service to point to the new URL.
 from __future__ import annotations
 
 from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Mapping
 
 
 @dataclass
@@ -16,54 +18,60 @@ class WBURL:
     description: str
 
 
+# Predefined URLs by name. Read-only and shared by every Registry.
+_URLS: Mapping[str, WBURL] = MappingProxyType(
+    {
+        "wandb-launch": WBURL(
+            "https://tracklab.me/launch",
+            "Link to the W&B launch marketing page",
+        ),
+        "wandb-init": WBURL(
+            "https://tracklab.me/wandb-init",
+            "Link to the tracklab.init reference documentation page",
+        ),
+        "define-metric": WBURL(
+            "https://tracklab.me/define-metric",
+            "Link to the W&B developer guide documentation page on tracklab.define_metric",
+        ),
+        "developer-guide": WBURL(
+            "https://tracklab.me/developer-guide",
+            "Link to the W&B developer guide top level page",
+        ),
+        "wandb-core": WBURL(
+            "https://tracklab.me/wandb-core",
+            "Link to the documentation for the wandb-core service",
+        ),
+        "wandb-server": WBURL(
+            "https://tracklab.me/wandb-server",
+            "Link to the documentation for the self-hosted W&B server",
+        ),
+        "multiprocess": WBURL(
+            "https://tracklab.me/multiprocess",
+            (
+                "Link to the W&B developer guide documentation page on how to "
+                "use wandb in a multiprocess environment"
+            ),
+        ),
+    }
+)
+
+
 class Registry:
     """A collection of URLs that can be associated with a name."""
 
     def __init__(self) -> None:
-        self.urls: dict[str, WBURL] = {
-            "wandb-launch": WBURL(
-                "https://tracklab.me/launch",
-                "Link to the W&B launch marketing page",
-            ),
-            "wandb-init": WBURL(
-                "https://tracklab.me/wandb-init",
-                "Link to the tracklab.init reference documentation page",
-            ),
-            "define-metric": WBURL(
-                "https://tracklab.me/define-metric",
-                "Link to the W&B developer guide documentation page on tracklab.define_metric",
-            ),
-            "developer-guide": WBURL(
-                "https://tracklab.me/developer-guide",
-                "Link to the W&B developer guide top level page",
-            ),
-            "wandb-core": WBURL(
-                "https://tracklab.me/wandb-core",
-                "Link to the documentation for the wandb-core service",
-            ),
-            "wandb-server": WBURL(
-                "https://tracklab.me/wandb-server",
-                "Link to the documentation for the self-hosted W&B server",
-            ),
-            "multiprocess": WBURL(
-                "https://tracklab.me/multiprocess",
-                (
-                    "Link to the W&B developer guide documentation page on how to "
-                    "use wandb in a multiprocess environment"
-                ),
-            ),
-        }
+        self.urls: Mapping[str, WBURL] = _URLS
 
     def url(self, name: str) -> str:
         """Get the URL associated with the given name."""
-        wb_url = self.urls.get(name)
+        wb_url = _URLS.get(name)
         if wb_url:
             return wb_url.url
         raise ValueError(f"URL not found for {name}")
 
     def description(self, name: str) -> str:
         """Get the description associated with the given name."""
-        wb_url = self.urls.get(name)
+        wb_url = _URLS.get(name)
         if wb_url:
             return wb_url.description
         raise ValueError(f"Description not found for {name}")
@@ -1,6 +1,7 @@
 from typing import Optional, Dict, Any
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 
 from . import AuthenticationError, CommError, Error, UnsupportedError, UsageError
 
@@ -14,6 +15,10 @@ class ErrorCode(Enum):
     UNSUPPORTED = "UNSUPPORTED"
 
 
+# Error codes by their serialized value
+_STR_TO_CODE = {code.value: code for code in ErrorCode}
+
+
 @dataclass
 class ErrorInfo:
     """Error information (replacing protobuf ErrorInfo)."""
@@ -31,7 +36,7 @@ class ErrorInfo:
     def from_dict(cls, data: Dict[str, Any]) -> "ErrorInfo":
         """Create from dictionary."""
         return cls(
-            code=ErrorCode(data.get("code", "UNKNOWN")),
+            code=_STR_TO_CODE.get(data.get("code"), ErrorCode.UNKNOWN),
             message=data.get("message", "")
         )
 
@@ -47,6 +52,16 @@ to_exception_map = {
 from_exception_map = {v: k for k, v in to_exception_map.items()}
 
 
+@lru_cache(maxsize=64)
+def _code_for_class(exc_class: type) -> ErrorCode:
+    """Find the error code of the closest mapped base class of an exception."""
+    for subclass in exc_class.__mro__:
+        code = from_exception_map.get(subclass)
+        if code is not None:
+            return code
+    return ErrorCode.UNKNOWN
+
+
 class ProtobufErrorHandler:
     """Converts errors to exceptions and vice versa."""
 
@@ -64,9 +79,7 @@ class ProtobufErrorHandler:
         if not error.message:
             return None
 
-        if error.code in to_exception_map:
-            return to_exception_map[error.code](error.message)
-        return Error(error.message)
+        return to_exception_map.get(error.code, Error)(error.message)
 
     @classmethod
     def from_exception(cls, exc: Error) -> ErrorInfo:
@@ -81,9 +94,4 @@ class ProtobufErrorHandler:
         if not isinstance(exc, Error):
             raise TypeError("exc must be a subclass of tracklab.errors.Error")
 
-        code = ErrorCode.UNKNOWN
-        for subclass in type(exc).__mro__:
-            if subclass in from_exception_map:
-                code = from_exception_map[subclass]
-                break
-        return ErrorInfo(code=code, message=str(exc))
+        return ErrorInfo(code=_code_for_class(type(exc)), message=str(exc))
@@ -8,8 +8,8 @@ from tracklab.core import (
     DataStore, get_data_store,
     RunRecord, HistoryRecord, ConfigRecord, SummaryRecord, 
     MetricRecord, OutputRecord, StatsRecord, FilesRecord,
-    HistoryItem, ConfigItem, SummaryItem, StatsItem, FilesItem,
-    Record, RecordType
+    HistoryItem, HistoryStep, ConfigItem, SummaryItem, StatsItem, FilesItem,
+    Record, RecordType, OutputType, StatsType
 )
 from datetime import datetime
 
@@ -72,18 +72,20 @@ class Interface:
         
     def publish_metric(self, name: str, value: Any, step: Optional[int] = None) -> None:
         """发布指标"""
-        # 记录历史数据
+        record = self._metric_record(name, value, step)
+        self.data_store.write_record(record)
+        logger.debug(f"Published metric: {name} = {value} (step={step})")
+        
+    def _metric_record(self, name: str, value: Any, step: Optional[int]) -> Record:
+        """构建单个指标的历史记录"""
         history_item = HistoryItem(key=name)
         history_item.set_value(value)
         
         history_record = HistoryRecord(item=[history_item])
         if step is not None:
-            from tracklab.core.core_records import HistoryStep
             history_record.step = HistoryStep(num=step)
             
-        record = Record(history=history_record)
-        self.data_store.write_record(record)
-        logger.debug(f"Published metric: {name} = {value} (step={step})")
+        return Record(history=history_record)
         
     def publish_summary(self, key: str, value: Any, nested_key: Optional[list] = None) -> None:
         """发布摘要数据"""
@@ -97,8 +99,6 @@ class Interface:
         
     def publish_output(self, line: str, output_type: str = "stdout") -> None:
         """发布输出"""
-        from tracklab.core.base_models import OutputType
-        
         output_type_enum = OutputType.STDOUT if output_type == "stdout" else OutputType.STDERR
         output_record = OutputRecord(line=line, output_type=output_type_enum)
         record = Record(output=output_record)
@@ -107,8 +107,6 @@ class Interface:
         
     def publish_stats(self, stats_dict: Dict[str, Any], stats_type: str = "system") -> None:
         """发布统计信息"""
-        from tracklab.core.base_models import StatsType
-        
         stats_type_enum = getattr(StatsType, stats_type.upper(), StatsType.SYSTEM)
         
         items = []
@@ -134,8 +132,10 @@ class Interface:
     
     def publish_history(self, data: Dict[str, Any], step: Optional[int] = None) -> None:
         """发布历史数据（批量指标）"""
-        for key, value in data.items():
-            self.publish_metric(key, value, step)
+        # 同一步的所有指标在一个批次中写入
+        records = [self._metric_record(key, value, step) for key, value in data.items()]
+        self.data_store.write_records(records)
+        logger.debug(f"Published history: {len(records)} metrics (step={step})")
             
     def publish_alert(self, title: str, text: str, level: str = "INFO") -> None:
         """发布警告"""
@@ -158,7 +158,10 @@ def coalesce(*arg: Any) -> Any:
 
     Similar to ?? in C#.
     """
-    return next((a for a in arg if a is not None), None)
+    for a in arg:
+        if a is not None:
+            return a
+    return None
 
 
 def sample_with_exponential_decay_weights(
@@ -41,6 +41,9 @@ except ImportError:
 # Constants
 VALUE_BYTES_LIMIT = 1024
 
+# Types json_friendly returns unchanged (finite floats are handled alongside)
+_PASSTHROUGH_TYPES = frozenset((str, int, bool, type(None)))
+
 
 def _numpy_generic_convert(obj: Any) -> Any:
     """Convert numpy generic types to Python types."""
@@ -60,6 +63,12 @@ def _sanitize_numpy_keys(obj: Any) -> Any:
 
 def json_friendly(obj: Any) -> Tuple[Any, bool]:
     """Convert an object into something that's more becoming of JSON."""
+    # Builtin scalars are by far the most common values and none of the
+    # checks below applies to them, so skip the chain for exact matches
+    obj_type = type(obj)
+    if obj_type in _PASSTHROUGH_TYPES or (obj_type is float and math.isfinite(obj)):
+        return obj, False
+    
     converted = True
     typename = get_full_typename(obj)
     
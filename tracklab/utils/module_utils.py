@@ -6,11 +6,11 @@ import sys
 import threading
 import types
 from importlib import import_module
-from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, Optional, Set, Tuple, Union
 from types import ModuleType
 
 # Global variables for module management
-_not_importable: List[str] = []
+_not_importable: Set[str] = set()
 
 # Pre-import common modules
 np = None  # Will be loaded lazily
@@ -144,7 +144,7 @@ def get_module(
             else:
                 raise ImportError(f"No module named {name}")
         
-        _not_importable.append(name)
+        _not_importable.add(name)
         return None
 
 
@@ -1,12 +1,13 @@
 """Type detection and validation for ML frameworks and data types."""
 
+import sys
 from typing import Any, Optional, Sequence
 
 # Import from module_utils to get common modules
 try:
-    from .module_utils import np, pd_available
+    from .module_utils import LazyModule, get_module, np, pd_available
 except ImportError:
-    from module_utils import np, pd_available
+    from module_utils import LazyModule, get_module, np, pd_available
 
 
 def get_full_typename(o: Any) -> str:
@@ -36,14 +37,17 @@ def get_h5_typename(o: Any) -> str:
     return typename
 
 
+# Tensor and DataFrame checks look frameworks up in sys.modules rather than
+# importing them: an object can only be a framework's tensor once that
+# framework is loaded, and a failed import is retried (and pays the path
+# search) on every call.
+
+
 # TensorFlow detection
 def is_tf_tensor(obj: Any) -> bool:
     """Check if object is a TensorFlow tensor."""
-    try:
-        import tensorflow  # type: ignore
-        return isinstance(obj, tensorflow.Tensor)
-    except ImportError:
-        return False
+    tensorflow = sys.modules.get("tensorflow")
+    return tensorflow is not None and isinstance(obj, tensorflow.Tensor)
 
 
 def is_tf_tensor_typename(typename: str) -> bool:
@@ -61,11 +65,8 @@ def is_tf_eager_tensor_typename(typename: str) -> bool:
 # PyTorch detection
 def is_pytorch_tensor(obj: Any) -> bool:
     """Check if object is a PyTorch tensor."""
-    try:
-        import torch  # type: ignore
-        return isinstance(obj, torch.Tensor)
-    except ImportError:
-        return False
+    torch = sys.modules.get("torch")
+    return torch is not None and isinstance(obj, torch.Tensor)
 
 
 def is_pytorch_tensor_typename(typename: str) -> bool:
@@ -83,12 +84,9 @@ def is_jax_tensor_typename(typename: str) -> bool:
 
 def get_jax_tensor(obj: Any) -> Optional[Any]:
     """Get JAX tensor if available."""
-    try:
-        import jax.numpy as jnp  # type: ignore
-        if isinstance(obj, jnp.ndarray):
-            return obj
-    except ImportError:
-        pass
+    jnp = sys.modules.get("jax.numpy")
+    if jnp is not None and isinstance(obj, jnp.ndarray):
+        return obj
     return None
 
 
@@ -106,10 +104,12 @@ def is_pandas_data_frame_typename(typename: str) -> bool:
 
 def is_pandas_data_frame(obj: Any) -> bool:
     """Check if object is a pandas DataFrame."""
-    if pd_available:
-        import pandas as pd
-        return isinstance(obj, pd.DataFrame)
-    return False
+    pd = sys.modules.get("pandas") if pd_available else None
+    # pandas is registered lazily by module_utils; until something loads it,
+    # no DataFrame can exist, and touching pd.DataFrame would load it
+    if pd is None or type(pd) is LazyModule:
+        return False
+    return isinstance(obj, pd.DataFrame)
 
 
 # Matplotlib detection
@@ -118,43 +118,46 @@ def is_matplotlib_typename(typename: str) -> bool:
     return typename.startswith("matplotlib.")
 
 
+# The helpers below go through get_module, which remembers modules that failed
+# to import instead of retrying the import on every call.
 def ensure_matplotlib_figure(obj: Any) -> Any:
     """Ensure object is a matplotlib figure."""
-    try:
-        import matplotlib.pyplot as plt  # type: ignore
-        if hasattr(obj, "figure"):
-            return obj.figure
-        elif hasattr(obj, "get_figure"):
-            return obj.get_figure()
-        else:
-            return plt.gcf()
-    except ImportError:
+    plt = get_module("matplotlib.pyplot", lazy=False)
+    if plt is None:
         return obj
+    if hasattr(obj, "figure"):
+        return obj.figure
+    elif hasattr(obj, "get_figure"):
+        return obj.get_figure()
+    else:
+        return plt.gcf()
 
 
 def matplotlib_to_plotly(obj: Any) -> Any:
     """Convert matplotlib figure to plotly figure."""
-    try:
-        import plotly.tools as tls  # type: ignore
-        return tls.mpl_to_plotly(obj)
-    except ImportError:
+    tls = get_module("plotly.tools", lazy=False)
+    if tls is None:
         return obj
+    return tls.mpl_to_plotly(obj)
 
 
 def matplotlib_contains_images(obj: Any) -> bool:
     """Check if matplotlib figure contains images."""
-    try:
-        import matplotlib.image as mpimg  # type: ignore
-        if hasattr(obj, "get_children"):
-            for child in obj.get_children():
-                if isinstance(child, mpimg.AxesImage):
-                    return True
-                if hasattr(child, "get_children"):
-                    if matplotlib_contains_images(child):
-                        return True
-        return False
-    except ImportError:
+    mpimg = get_module("matplotlib.image", lazy=False)
+    if mpimg is None:
         return False
+    return _contains_instance(obj, mpimg.AxesImage)
+
+
+def _contains_instance(obj: Any, cls: type) -> bool:
+    """Check if any descendant of a matplotlib artist is an instance of cls."""
+    if hasattr(obj, "get_children"):
+        for child in obj.get_children():
+            if isinstance(child, cls):
+                return True
+            if _contains_instance(child, cls):
+                return True
+    return False
 
 
 # Plotly detection